@@ -19,6 +19,7 @@ days_back=args.days_back,
 table_css=args.table_css,
 )
 flow["steps"].append({"event": "first_pass_records", "count": len(records)})
+records_by_doc = {r["Doc Number"]: r for r in records}
 
 
 if rescrape_list:
@@ -32,13 +33,11 @@ wait_secs=args.wait,
 days_back=args.days_back,
 table_css=args.table_css,
 )
-by_doc = {r["Doc Number"]: r for r in records}
-for r in more:
-by_doc[r["Doc Number"]] = r
-records = list(by_doc.values())
+records_by_doc.update((r["Doc Number"], r) for r in more)
 flow["steps"].append({"event": "rescrape_records", "index": idx, "count": len(more)})
 
 
+records = list(records_by_doc.values())
 json_path, csv_path = save_json_csv(records, args.out, args.county_slug, args.skip_csv)
 flow["finished_ok"] = True
 flow["records"] = len(records)